@@ -3,11 +3,185 @@ Excel Autofiller Module
 Handles automated filling of cash sheet Excel workbooks with parsed sales data.
 """
 
-from openpyxl import load_workbook
+import os
+import tempfile
 import traceback
+import xml.etree.ElementTree as ET
+import zipfile
+
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter, column_index_from_string
 from config import FILL_COL_MAP, CHECKING_COL_MAP
 
 
+# Opt-in fast save path: patch the modified sheet's XML inside the .xlsx zip
+# instead of letting openpyxl re-serialize the whole workbook. Experimental,
+# so it is enabled via environment variable and always falls back to a normal
+# openpyxl save if anything about the file looks unexpected.
+_FAST_PATCH = os.environ.get("CASHEET_FAST_PATCH") == "1"
+
+_XLSX_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_XLSX_REL_ID_ATTR = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_XLSX_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def _find_sheet_entry(zf, sheet_name):
+    """
+    Map a worksheet name to its XML entry inside the .xlsx zip.
+
+    Args:
+        zf (zipfile.ZipFile): Open workbook archive
+        sheet_name (str): Worksheet name (e.g., 'Wednesday')
+
+    Returns:
+        str: Archive path of the sheet XML (e.g., 'xl/worksheets/sheet3.xml')
+    """
+    workbook_root = ET.fromstring(zf.read('xl/workbook.xml'))
+    rel_id = None
+    for sheet in workbook_root.iter(f'{{{_XLSX_MAIN_NS}}}sheet'):
+        if sheet.get('name') == sheet_name:
+            rel_id = sheet.get(_XLSX_REL_ID_ATTR)
+            break
+    if rel_id is None:
+        raise KeyError(f"Worksheet '{sheet_name}' not found in workbook.xml")
+
+    rels_root = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels_root.iter(f'{{{_XLSX_PKG_REL_NS}}}Relationship'):
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target').lstrip('/')
+            return target if target.startswith('xl/') else 'xl/' + target
+    raise KeyError(f"No relationship target for worksheet '{sheet_name}'")
+
+
+def _patch_sheet_xml(xml_bytes, cell_updates):
+    """
+    Apply cell value updates to a single worksheet's XML.
+
+    Numbers are written as <v> elements and strings as inline strings, so the
+    shared strings table never needs touching. Existing cell styles are kept;
+    any formula in an updated cell is replaced, matching openpyxl assignment.
+
+    Args:
+        xml_bytes (bytes): Raw sheet XML from the archive
+        cell_updates (dict): (row, col) -> value (None clears the cell)
+
+    Returns:
+        bytes: Patched sheet XML
+    """
+    ET.register_namespace('', _XLSX_MAIN_NS)
+    ns = f'{{{_XLSX_MAIN_NS}}}'
+    root = ET.fromstring(xml_bytes)
+    sheet_data = root.find(f'{ns}sheetData')
+    if sheet_data is None:
+        raise ValueError("sheetData element not found")
+
+    rows = {int(row_el.get('r')): row_el for row_el in sheet_data}
+
+    for (row_num, col_num), value in sorted(cell_updates.items()):
+        row_el = rows.get(row_num)
+        if row_el is None:
+            row_el = ET.Element(f'{ns}row', {'r': str(row_num)})
+            position = len(sheet_data)
+            for i, existing in enumerate(sheet_data):
+                if int(existing.get('r')) > row_num:
+                    position = i
+                    break
+            sheet_data.insert(position, row_el)
+            rows[row_num] = row_el
+
+        ref = f"{get_column_letter(col_num)}{row_num}"
+        cell_el = None
+        position = len(row_el)
+        for i, existing in enumerate(row_el):
+            existing_col = column_index_from_string(
+                ''.join(ch for ch in existing.get('r') if ch.isalpha()))
+            if existing_col == col_num:
+                cell_el = existing
+                break
+            if existing_col > col_num:
+                position = i
+                break
+        if cell_el is None:
+            cell_el = ET.Element(f'{ns}c', {'r': ref})
+            row_el.insert(position, cell_el)
+
+        # Reset any previous content, keeping the style attribute
+        for child in list(cell_el):
+            cell_el.remove(child)
+        cell_el.attrib.pop('t', None)
+
+        if value is None:
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            ET.SubElement(cell_el, f'{ns}v').text = repr(value)
+        else:
+            cell_el.set('t', 'inlineStr')
+            is_el = ET.SubElement(cell_el, f'{ns}is')
+            ET.SubElement(is_el, f'{ns}t').text = str(value)
+
+    return ET.tostring(root, encoding='UTF-8', xml_declaration=True)
+
+
+def _fast_patch(xl_path, updates):
+    """
+    Rewrite only the modified sheet XML entries of a workbook zip.
+
+    All other archive entries (styles, shared strings, the untouched day tabs)
+    are copied through verbatim, avoiding openpyxl's full re-serialization.
+    The new archive is written to a temp file and swapped in atomically.
+
+    Args:
+        xl_path (str): Path to the .xlsx file
+        updates (list): (sheet_name, row, col, value) tuples recorded while filling
+    """
+    updates_by_sheet = {}
+    for sheet_name, row, col, value in updates:
+        updates_by_sheet.setdefault(sheet_name, {})[(row, col)] = value
+
+    with zipfile.ZipFile(xl_path) as zf:
+        patched = {}
+        for sheet_name, cell_updates in updates_by_sheet.items():
+            entry = _find_sheet_entry(zf, sheet_name)
+            patched[entry] = _patch_sheet_xml(zf.read(entry), cell_updates)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(xl_path) or '.', suffix='.xlsx')
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as out:
+                for item in zf.infolist():
+                    data = patched.get(item.filename)
+                    if data is None:
+                        data = zf.read(item.filename)
+                    out.writestr(item, data)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    os.replace(tmp_path, xl_path)
+
+
+def save_workbook(wb, xl_path):
+    """
+    Save a workbook, using the raw-XML fast patch when enabled.
+
+    Falls back to a normal openpyxl save whenever fast patching is disabled,
+    no cell updates were recorded, or the file structure is unexpected.
+
+    Args:
+        wb: Openpyxl workbook object
+        xl_path (str): Destination path
+    """
+    updates = getattr(wb, '_fast_patch_updates', None)
+    if _FAST_PATCH and updates:
+        try:
+            _fast_patch(xl_path, updates)
+            return
+        except Exception as e:
+            print(f"  ⚠️  Fast patch failed ({e}) - falling back to full save")
+    wb.save(xl_path)
+
+
 class ExcelAutofiller:
     """
     Automates the process of filling cash sheet Excel files with sales data.
@@ -22,7 +196,11 @@ class ExcelAutofiller:
         ws: Openpyxl worksheet object
     """
 
-    def __init__(self, xl_path, location, week_day):
+    # Location -> row indices keyed by (workbook path, worksheet name), shared
+    # across instances so a worksheet is only scanned once per run
+    _row_index_cache = {}
+
+    def __init__(self, xl_path, location, week_day, wb=None):
         """
         Initialize the ExcelAutofiller.
 
@@ -30,24 +208,34 @@ class ExcelAutofiller:
             xl_path (str): Full path to the Excel workbook
             location (str): Location name to search for in the workbook
             week_day (str): Worksheet name (e.g., 'Monday', 'Tuesday')
+            wb (optional): Already-loaded openpyxl workbook for this path.
+                Several locations share one casheet file, so the caller can
+                load it once and reuse it for every report targeting it.
         """
         self.xl_path = xl_path
         self.location = location
+        self._location_lc = location.strip().lower()  # Normalized once for lookups
         self.week_day = week_day
         self.start_row = 4  # Data starts at row 4 (after headers)
         self.row = 0
-        self.wb = None
+        self.wb = wb
         self.ws = None
+        self._computed_over = None      # Over/short computed from parser data
+        self._needs_formula_eval = False  # True when we must reload for formula results
 
     def open_workbook(self):
         """
         Open and load the Excel workbook and specified worksheet.
 
+        Skips the load entirely when a pre-loaded workbook was passed to
+        __init__ (shared casheet files are parsed only once per run).
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            self.wb = load_workbook(self.xl_path)
+            if self.wb is None:
+                self.wb = load_workbook(self.xl_path)
 
             # Check if the worksheet exists
             if self.week_day not in self.wb.sheetnames:
@@ -85,16 +273,40 @@ class ExcelAutofiller:
             print("  ❌ 'location' column not defined in FILL_COL_MAP")
             return False
 
-        # Search through rows starting from start_row
-        for r in range(self.start_row, self.ws.max_row + 1):
-            cell_value = self.ws.cell(r, location_col).value
-
-            # Check if cell has value and matches location (case-insensitive, stripped)
-            if cell_value and cell_value.strip().lower() == self.location.lower():
-                self.row = r
-                print(
-                    f"  ✓ Found location '{self.location}' at row {self.row}")
-                return True
+        # Build the location -> row index once per worksheet; reports that
+        # share a casheet then resolve their row with a single dict lookup
+        cache_key = (self.xl_path, self.week_day)
+        row_index = self._row_index_cache.get(cache_key)
+
+        if row_index is None:
+            # Locations are contiguous from start_row, so a run of blank cells
+            # means the data is over - stop there instead of walking out to
+            # ws.max_row, which can be inflated on dirty worksheets
+            row_index = {}
+            blank_run = 0
+            row_num = self.start_row
+            for (value,) in self.ws.iter_rows(
+                    min_row=self.start_row, min_col=location_col,
+                    max_col=location_col, values_only=True):
+                if isinstance(value, str):
+                    row_index[value.strip().lower()] = row_num
+                    blank_run = 0
+                elif value is None:
+                    blank_run += 1
+                    if blank_run >= 3:
+                        break
+                else:
+                    blank_run = 0
+                row_num += 1
+            self._row_index_cache[cache_key] = row_index
+
+        row = row_index.get(self._location_lc)
+
+        if row is not None:
+            self.row = row
+            print(
+                f"  ✓ Found location '{self.location}' at row {self.row}")
+            return True
 
         # Location not found
         print(
@@ -102,13 +314,41 @@ class ExcelAutofiller:
         print(f"     Searched rows {self.start_row} to {self.ws.max_row}")
         return False
 
-    def checking_tenders(self):
+    def _set_cell(self, row, col, value):
+        """
+        Write one cell value, recording it for the fast-patch save path.
+
+        Args:
+            row (int): Worksheet row number
+            col (int): Worksheet column number
+            value: Value to write (None clears the cell)
+        """
+        self.ws.cell(row, col).value = value
+        if _FAST_PATCH:
+            updates = getattr(self.wb, '_fast_patch_updates', None)
+            if updates is None:
+                updates = self.wb._fast_patch_updates = []
+            updates.append((self.week_day, row, col, value))
+
+    def checking_tenders(self, over_amount=None):
         """
         Verify that tender calculations are correct by checking the 'over/short' column.
 
+        Args:
+            over_amount (float, optional): Pre-computed over/short value. When given,
+                the worksheet is not read at all.
+
         Returns:
             bool: True if tenders balance correctly (over/short is 0 or None), False otherwise
         """
+        # Fast path: validate the value computed in filling() without touching the sheet
+        if over_amount is not None:
+            if abs(over_amount) > 0.005:  # Tolerate sub-cent float noise
+                print(
+                    f"  ⚠️  Tender discrepancy detected: ${over_amount:.2f}")
+                return False
+            return True
+
         over_col = CHECKING_COL_MAP.get("over")
 
         if over_col is None:
@@ -117,8 +357,18 @@ class ExcelAutofiller:
             return True
 
         over_value = self.ws.cell(self.row, over_col).value
+        return self._over_value_balances(over_value)
 
-        # Check if there's a discrepancy
+    def _over_value_balances(self, over_value):
+        """
+        Check a raw over/short cell value for a discrepancy.
+
+        Args:
+            over_value: Cell value from the over/short column (may be None)
+
+        Returns:
+            bool: True if the value is 0 or None, False otherwise
+        """
         if over_value is not None:
             try:
                 over_amount = float(over_value)
@@ -156,46 +406,56 @@ class ExcelAutofiller:
             # Tax is typically on the row below the main data row
             tax_row = self.row + 1
 
-            # Step 2: Fill basic performance metrics
+            # Step 2: Gather all cell updates first - the performance metrics
+            # and the tender amounts - then apply them in one pass below. The
+            # same (row, col, value) stream feeds the fast-patch save path.
+            updates = []
+
             date_col = FILL_COL_MAP.get("date")
             if date_col:
-                self.ws.cell(1, date_col).value = parser.get("date")
+                updates.append((1, date_col, parser.get("date")))
 
             count_col = FILL_COL_MAP.get("count")
             if count_col:
-                self.ws.cell(self.row, count_col).value = parser.get("count")
+                updates.append((self.row, count_col, parser.get("count")))
 
             total_sales_col = FILL_COL_MAP.get("total_sales")
             if total_sales_col:
-                self.ws.cell(self.row, total_sales_col).value = parser.get(
-                    "total_sales")
+                updates.append(
+                    (self.row, total_sales_col, parser.get("total_sales")))
 
             tax_col = FILL_COL_MAP.get("tax")
             if tax_col:
-                self.ws.cell(tax_row, tax_col).value = parser.get("tax")
+                updates.append((tax_row, tax_col, parser.get("tax")))
 
-            # Step 3: Fill tender amounts
             tenders = parser.get("tenders", {})
             unmatched_tenders = []
 
             for tender_name, amount in tenders.items():
-                if tender_name not in FILL_COL_MAP:
+                col = FILL_COL_MAP.get(tender_name)
+                if col is None:
                     unmatched_tenders.append(tender_name)
                     continue
 
-                col = FILL_COL_MAP[tender_name]
-
                 # Only fill non-zero amounts; clear zero amounts
                 if amount > 0:
-                    self.ws.cell(self.row, col).value = amount
+                    updates.append((self.row, col, amount))
                 elif amount == 0:
-                    self.ws.cell(self.row, col).value = None
+                    updates.append((self.row, col, None))
+
+            # Step 3: Apply every update in a single pass
+            for row, col, value in updates:
+                self._set_cell(row, col, value)
 
             # Report any unmatched tenders
             if unmatched_tenders:
                 print(
                     f"  ⚠️  Unmatched tenders (not filled): {', '.join(unmatched_tenders)}")
 
+            # Capture the over/short cell now so validation can run without
+            # reloading the workbook from disk
+            self._compute_over()
+
             print(f"  ✓ {self.location} filled successfully")
             return True
 
@@ -208,24 +468,86 @@ class ExcelAutofiller:
             traceback.print_exc()
             return False
 
-    def save(self):
+    def _compute_over(self):
+        """
+        Capture the over/short cell value from the in-memory worksheet.
+
+        The over/short column is the only checking column that filling() never
+        writes, so its current value can be validated directly: a literal
+        number or an empty cell is conclusive on its own, while a formula can
+        only be resolved by reloading a saved copy of the file (Excel's cached
+        result), which is deferred to validate_from_disk().
+        """
+        self._computed_over = None
+        self._needs_formula_eval = False
+
+        over_col = CHECKING_COL_MAP.get("over")
+        if over_col is None:
+            return
+
+        over_value = self.ws.cell(self.row, over_col).value
+        if isinstance(over_value, str) and over_value.startswith('='):
+            # Formula - only Excel's cached result can resolve this
+            self._needs_formula_eval = True
+        else:
+            self._computed_over = over_value
+
+    def validate(self):
+        """
+        Validate the filled data against the in-memory workbook.
+
+        Uses the over/short value computed in filling(), so no disk access is
+        needed. Saving is deferred to the caller, which writes each (shared)
+        workbook exactly once after all reports have been filled.
+
+        Returns:
+            bool or None: True if tenders balance, False if a discrepancy was
+                found, None if only Excel can evaluate the sheet formulas
+                (validate_from_disk() must run after the workbook is saved)
+        """
+        if self._needs_formula_eval:
+            return None
+
+        is_correct = self._over_value_balances(self._computed_over)
+
+        if is_correct:
+            print(
+                f"  ✅ {self.location} validated - all tenders balance correctly")
+        else:
+            print(
+                f"  ⚠️  {self.location} validation warning - check over/short column")
+
+        return is_correct
+
+    def validate_from_disk(self):
         """
-        Save the workbook and validate the filled data.
+        Validate by reloading the saved workbook with calculated formula values.
+
+        Fallback for the rare case where validate() cannot compute over/short
+        in Python. Must be called after the workbook has been saved to disk.
 
         Returns:
-            bool: True if save successful and data validates correctly, False otherwise
+            bool: True if tenders balance correctly, False otherwise
         """
         try:
-            # Step 1: Save the workbook
-            self.wb.save(self.xl_path)
-            print(f"  💾 Saved: {self.location} casheet")
+            over_col = CHECKING_COL_MAP.get("over")
 
-            # Step 2: Reload workbook with calculated formulas (data_only=True)
-            self.wb = load_workbook(self.xl_path, data_only=True)
-            self.ws = self.wb[self.week_day]
+            if over_col is None:
+                print(
+                    "  ⚠️  'over' column not defined in CHECKING_COL_MAP - skipping validation")
+                return True
 
-            # Step 3: Validate tender calculations
-            is_correct = self.checking_tenders()
+            # read_only streams the sheet instead of building the full object
+            # graph - we only need a single cell from one of the seven day tabs
+            wb = load_workbook(self.xl_path, data_only=True, read_only=True)
+            try:
+                ws = wb[self.week_day]
+                over_value = ws[
+                    f"{get_column_letter(over_col)}{self.row}"].value
+            finally:
+                wb.close()  # Release the zip file handle immediately
+
+            is_correct = self._over_value_balances(over_value)
 
             if is_correct:
                 print(
@@ -236,12 +558,8 @@ class ExcelAutofiller:
 
             return is_correct
 
-        except PermissionError:
-            print(f"  ❌ Cannot save: File is open in another program")
-            return False
-
         except Exception as e:
-            print(f"  ❌ Save error: {e}")
+            print(f"  ❌ Validation error: {e}")
             return False
 
     def close(self):
@@ -3,16 +3,27 @@ Main Execution Module with Enhanced Error Tracking
 Processes Infor and Tavlo reports and tracks errors by location.
 """
 
-from calendar import weekday
+import io
 import os
 from infor_parser import InforParser
 from tavlo_parser import TavloParser
-from excel_autofiller import ExcelAutofiller
-from datetime import date, timedelta
-from dateutil.parser import parse
+from excel_autofiller import ExcelAutofiller, save_workbook
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from config import REPORTS_CASHSHEET_MAP, REPORTS_FOLDER, CASH_SHEET_FOLDER
 
 
+# Accepted date formats for the cash sheet day prompt
+DATE_FORMATS = ("%m/%d/%Y", "%m-%d-%Y", "%m/%d/%y", "%m-%d-%y")
+
+# Below this many reports, worker-process startup costs more than the
+# parallel fill saves, so --parallel quietly falls back to sequential
+PARALLEL_MIN_REPORTS = 4
+
+
 class ProcessingTracker:
     """
     Tracks processing results for all reports including success, failures, and validation warnings.
@@ -41,6 +52,21 @@ class ProcessingTracker:
             'error_message': error_message
         })
 
+    def downgrade_to_failure(self, location, filename, error_type, error_message):
+        """Reclassify an already-recorded success as a failure (used when the
+        deferred save of a casheet raises after its fills were recorded)."""
+        self.successful = [success for success in self.successful
+                           if not (success['location'] == location
+                                   and success['filename'] == filename)]
+        self.add_failure(location, filename, error_type, error_message)
+
+    def flag_success_warning(self, location, filename):
+        """Mark an already-recorded success as having a warning (used when a
+        deferred validation fails after the success was recorded)."""
+        for success in self.successful:
+            if success['location'] == location and success['filename'] == filename:
+                success['has_warning'] = True
+
     def add_validation_warning(self, location, filename, discrepancy_amount=None):
         """Add a validation warning (tender discrepancy)."""
         self.validation_warnings.append({
@@ -60,62 +86,72 @@ class ProcessingTracker:
         """Print a comprehensive summary of all processing results."""
         total = len(self.successful) + len(self.failed)
 
-        print("\n" + "=" * 80)
-        print("=" * 80)
-        print("📊 PROCESSING SUMMARY")
+        # Build the whole summary in one buffer and emit it with a single
+        # write - dozens of small line-buffered prints are slow in conhost
+        buf = io.StringIO()
+
+        print("\n" + "=" * 80, file=buf)
+        print("=" * 80, file=buf)
+        print("📊 PROCESSING SUMMARY", file=buf)
 
         # Overall stats
-        print(f"\n📈 Overall Statistics:")
-        print(f"   ✅ Successful: {len(self.successful)}")
-        print(f"   ❌ Failed: {len(self.failed)}")
-        print(f"   ⚠️  Validation Warnings: {len(self.validation_warnings)}")
-        print(f"   📁 Total Processed: {total}")
+        print(f"\n📈 Overall Statistics:", file=buf)
+        print(f"   ✅ Successful: {len(self.successful)}", file=buf)
+        print(f"   ❌ Failed: {len(self.failed)}", file=buf)
+        print(
+            f"   ⚠️  Validation Warnings: {len(self.validation_warnings)}", file=buf)
+        print(f"   📁 Total Processed: {total}", file=buf)
 
         # Validation warnings (over/short issues)
         if self.validation_warnings:
-            print(f"\n⚠️  LOCATIONS WITH TENDER DISCREPANCIES:")
-            print(f"   {'Location':<30} {'File':<40} {'Issue'}")
-            print(f"   {'-' * 78}")
+            print(f"\n⚠️  LOCATIONS WITH TENDER DISCREPANCIES:", file=buf)
+            print(f"   {'Location':<30} {'File':<40} {'Issue'}", file=buf)
+            print(f"   {'-' * 78}", file=buf)
             for warning in self.validation_warnings:
                 location = warning['location'][:28]
                 filename = warning['filename'][:38]
                 issue = f"Over/Short ≠ 0" if warning['discrepancy'] is None else f"${warning['discrepancy']:.2f}"
-                print(f"   {location:<30} {filename:<40} {issue}")
-            print(f"\n   💡 Tip: Check these locations' tender entries for accuracy")
+                print(f"   {location:<30} {filename:<40} {issue}", file=buf)
+            print(
+                f"\n   💡 Tip: Check these locations' tender entries for accuracy", file=buf)
 
         # Unmapped locations
         if self.unmapped_locations:
-            print(f"\n🗺️  UNMAPPED LOCATIONS (Not in REPORTS_CASHSHEET_MAP):")
-            print(f"   {'Location':<30} {'File':<40}")
-            print(f"   {'-' * 72}")
+            print(
+                f"\n🗺️  UNMAPPED LOCATIONS (Not in REPORTS_CASHSHEET_MAP):", file=buf)
+            print(f"   {'Location':<30} {'File':<40}", file=buf)
+            print(f"   {'-' * 72}", file=buf)
             for item in self.unmapped_locations:
                 location = item['location'][:28]
                 filename = item['filename'][:38]
-                print(f"   {location:<30} {filename:<40}")
+                print(f"   {location:<30} {filename:<40}", file=buf)
             print(
-                f"\n   💡 Tip: Add these locations to REPORTS_CASHSHEET_MAP in config.py")
+                f"\n   💡 Tip: Add these locations to REPORTS_CASHSHEET_MAP in config.py", file=buf)
 
         # Failed reports
         if self.failed:
-            print(f"\n❌ FAILED REPORTS:")
-            print(f"   {'Location':<30} {'Error Type':<20} {'Details'}")
-            print(f"   {'-' * 78}")
+            print(f"\n❌ FAILED REPORTS:", file=buf)
+            print(f"   {'Location':<30} {'Error Type':<20} {'Details'}", file=buf)
+            print(f"   {'-' * 78}", file=buf)
             for failure in self.failed:
                 location = failure['location'][:28] if failure['location'] else 'Unknown'
                 error_type = failure['error_type'][:18]
                 error_msg = failure['error_message'][:25]
-                print(f"   {location:<30} {error_type:<20} {error_msg}")
+                print(f"   {location:<30} {error_type:<20} {error_msg}", file=buf)
 
         # Successful with warnings
         successful_with_warnings = [
             s for s in self.successful if s['has_warning']]
         if successful_with_warnings:
             print(
-                f"\n✅ Successful (with warnings): {len(successful_with_warnings)}")
+                f"\n✅ Successful (with warnings): {len(successful_with_warnings)}", file=buf)
             for item in successful_with_warnings:
-                print(f"   - {item['location']}")
+                print(f"   - {item['location']}", file=buf)
+
+        print("\n" + "=" * 80 + "\n", file=buf)
 
-        print("\n" + "=" * 80 + "\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 def get_weekday_name(report_date):
@@ -128,27 +164,76 @@ def get_weekday_name(report_date):
     Returns:
         str: Weekday name (e.g., 'Monday')
     """
-    try:
-        date_object = parse(report_date)
+    # The prompt only accepts a small closed set of formats, so probing them
+    # with strptime is much cheaper than a general-purpose dateutil parse
+    for date_format in DATE_FORMATS:
+        try:
+            date_object = datetime.strptime(report_date, date_format)
+        except (ValueError, TypeError):
+            continue
         weekday_name = date_object.strftime("%A")
         print(f"The date {report_date} is a {weekday_name}")
         return weekday_name
-    except (ValueError, TypeError):
-        print(f"✗ Error: Could not understand the enter date '{report_date}'.")
-        print(f"  Please use a standard format like MM/DD/YYYY or 10-22-25.")
-        # Return an empty string or raise an error to stop the program
-        return None
 
-
-def find_casheet(location, casheet_files):
-    casheet_name = REPORTS_CASHSHEET_MAP[location][0]
-    for casheet_file in casheet_files:
-        if casheet_name.strip() in casheet_file.strip():
-            return casheet_file
+    print(f"✗ Error: Could not understand the enter date '{report_date}'.")
+    print(f"  Please use a standard format like MM/DD/YYYY or 10-22-25.")
+    # Return an empty string or raise an error to stop the program
     return None
 
 
-def process_report(report_parser, casheet_dir, weekday, report_filename, tracker, casheet_files):
+def build_casheet_index(casheet_files):
+    """
+    Resolve each expected casheet name in REPORTS_CASHSHEET_MAP to an actual
+    file, once, so per-report lookups are a single dict hit instead of a
+    substring scan over the whole casheet folder.
+
+    Args:
+        casheet_files (list): Filenames found in the casheet folder
+
+    Returns:
+        dict: Expected casheet base name -> matching filename
+    """
+    casheet_index = {}
+    # Normalize every filename once up front rather than stripping both sides
+    # of the comparison again for each expected name
+    normalized_files = [(casheet_file.strip().lower(), casheet_file)
+                        for casheet_file in casheet_files]
+    for expected_name, _ in REPORTS_CASHSHEET_MAP.values():
+        if expected_name in casheet_index:
+            continue
+        name = expected_name.strip().lower()
+        for normalized, casheet_file in normalized_files:
+            if name in normalized:
+                casheet_index[expected_name] = casheet_file
+                break
+    return casheet_index
+
+
+@lru_cache(maxsize=None)
+def _map(location):
+    """
+    Cached REPORTS_CASHSHEET_MAP lookup.
+
+    The same location entry is read several times while a report is processed
+    (mapping check, casheet name, sheet row name); caching returns the same
+    tuple without re-hashing the key each time.
+
+    Args:
+        location (str): Location name from the report
+
+    Returns:
+        tuple or None: (casheet base name, location name in sheet), or None
+            if the location is unmapped
+    """
+    return REPORTS_CASHSHEET_MAP.get(location)
+
+
+def find_casheet(location, casheet_index):
+    return casheet_index.get(_map(location)[0])
+
+
+def process_report(report_parser, casheet_dir, weekday, report_filename, tracker,
+                   casheet_index, workbook_cache, dirty_paths, deferred_validations):
     """
     Generic function to process both Infor and Tavlo reports with error tracking.
 
@@ -158,6 +243,13 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
         weekday (str): Day of week for worksheet selection
         report_filename (str): Name of the report file being processed
         tracker (ProcessingTracker): Tracker instance for recording results
+        workbook_cache (dict): Loaded workbooks keyed by casheet path, shared
+            across reports so each file is parsed only once
+        dirty_paths (dict): Casheet paths with unsaved changes, mapped to the
+            (location, filename) pairs recorded against each path so a failed
+            save can downgrade those results afterwards
+        deferred_validations (list): (autofiller, location, filename) tuples
+            that need validation after the workbooks are saved
 
     Returns:
         bool: True if successful, False otherwise
@@ -184,7 +276,8 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
         location = parser['location']
 
         # Step 2: Check if location exists in mapping
-        if location not in REPORTS_CASHSHEET_MAP:
+        mapping = _map(location)
+        if mapping is None:
             tracker.add_unmapped_location(location, report_filename)
             print(
                 f"⚠️  Cannot find the matched casheet with this report location: {location}")
@@ -196,10 +289,9 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
             print(f"💳 Tenders: {report_parser.all_tenders}\n")
 
         # Find information for casheet
-        location_in_casheet = REPORTS_CASHSHEET_MAP[location][1]
-        casheet_file = find_casheet(location, casheet_files)
+        expected_name, location_in_casheet = mapping
+        casheet_file = find_casheet(location, casheet_index)
         if casheet_file is None:
-            expected_name = REPORTS_CASHSHEET_MAP[location][0]
             error_msg = f"Casheet file not found in directory. Expected a file containing: {expected_name}"
 
             print(f"❌ {error_msg}")
@@ -212,10 +304,11 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
             return False
         casheet_path = os.path.join(casheet_dir, casheet_file)
 
-        # Step 3: Open casheet
+        # Step 3: Open casheet (reuse the workbook if another report already loaded it)
         try:
             casheet = ExcelAutofiller(
-                casheet_path, location_in_casheet, weekday)
+                casheet_path, location_in_casheet, weekday,
+                wb=workbook_cache.get(casheet_path))
         except FileNotFoundError:
             tracker.add_failure(
                 location=location,
@@ -237,6 +330,8 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
             print(f"❌ Failed to open workbook: {casheet_file}")
             return False
 
+        workbook_cache[casheet_path] = casheet.wb
+
         # Step 5: Fill data
         if not casheet.filling(parser):
             tracker.add_failure(
@@ -248,19 +343,28 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
             print(f"❌ Failed to fill the casheet: {casheet_file}")
             return False
 
-        # Step 6: Save and validate
-        validation_passed = casheet.save()
+        # Step 6: Mark dirty and validate (saving is deferred so shared
+        # casheets are written once, after all reports are filled)
+        dirty_paths.setdefault(casheet_path, []).append(
+            (location, report_filename))
+        validation_passed = casheet.validate()
 
-        if validation_passed:
+        if validation_passed is None:
+            # Needs formula evaluation - validate after the workbook is saved
+            deferred_validations.append((casheet, location, report_filename))
             tracker.add_success(location, report_filename, has_warning=False)
-            print(f"✅ Successfully saved: {casheet_file}")
+            print(f"✅ Filled, save pending: {casheet_file}")
+            return True
+        elif validation_passed:
+            tracker.add_success(location, report_filename, has_warning=False)
+            print(f"✅ Filled, save pending: {casheet_file}")
             return True
         else:
-            # Save succeeded but validation found discrepancy
+            # Filled but validation found discrepancy
             tracker.add_success(location, report_filename, has_warning=True)
             tracker.add_validation_warning(location, report_filename)
-            print(f"⚠️  Saved but validation warning: {casheet_file}")
-            return True  # Still count as success since data was saved
+            print(f"⚠️  Filled but validation warning: {casheet_file}")
+            return True  # Still count as success since data was filled
 
     except Exception as e:
         tracker.add_failure(
@@ -275,7 +379,147 @@ def process_report(report_parser, casheet_dir, weekday, report_filename, tracker
         return False
 
 
-def execute(reports_dir, casheet_dir, weekday, report_date):
+def _parse_and_resolve(report_parser, casheet_dir, report_filename, tracker, casheet_index):
+    """
+    Parse a report and resolve the casheet it targets, recording any failure
+    on the tracker.
+
+    Args:
+        report_parser: InforParser or TavloParser instance
+        casheet_dir (str): Directory containing cash sheet files
+        report_filename (str): Name of the report file being processed
+        tracker (ProcessingTracker): Tracker instance for recording results
+        casheet_index (dict): Expected casheet name -> filename index
+
+    Returns:
+        tuple or None: (parser_data, casheet_path, location_in_casheet) on
+            success, None if parsing or resolution failed
+    """
+    if not report_parser.parse():
+        tracker.add_failure(
+            location='Unknown',
+            filename=report_filename,
+            error_type='Parse Error',
+            error_message='Failed to parse report file'
+        )
+        print(f"❌ Failed to parse report: {report_filename}")
+        return None
+
+    parser_data = report_parser.get_data_dict()
+    location = parser_data['location']
+
+    mapping = _map(location)
+    if mapping is None:
+        tracker.add_unmapped_location(location, report_filename)
+        print(
+            f"⚠️  Cannot find the matched casheet with this report location: {location}")
+        tracker.add_validation_warning(location, report_filename)
+        return None
+
+    expected_name, location_in_casheet = mapping
+    casheet_file = find_casheet(location, casheet_index)
+    if casheet_file is None:
+        error_msg = f"Casheet file not found in directory. Expected a file containing: {expected_name}"
+        print(f"❌ {error_msg}")
+        tracker.add_failure(
+            location=location,
+            filename=report_filename,
+            error_type='File Not Found',
+            error_message=error_msg
+        )
+        return None
+
+    casheet_path = os.path.join(casheet_dir, casheet_file)
+    return parser_data, casheet_path, location_in_casheet
+
+
+def _fill_bucket(casheet_path, entries, weekday):
+    """
+    Worker for parallel mode: fill every report targeting one casheet file.
+
+    Runs in a separate process, so the workbook is loaded once, all rows are
+    filled, and the file is saved once - independent casheets proceed in
+    parallel. Results are returned as plain tuples for the parent to merge
+    into its ProcessingTracker.
+
+    Args:
+        casheet_path (str): Full path to the casheet workbook
+        entries (list): (parser_data, location_in_casheet, location,
+            report_filename) tuples for this workbook
+        weekday (str): Worksheet name (day of week)
+
+    Returns:
+        list: (location, report_filename, status, error_type, error_message)
+            tuples where status is 'ok', 'warn', or 'fail'
+    """
+    results = []
+    deferred = []
+    wb = None
+    filled_any = False
+    casheet_file = os.path.basename(casheet_path)
+
+    for parser_data, location_in_casheet, location, report_filename in entries:
+        casheet = ExcelAutofiller(
+            casheet_path, location_in_casheet, weekday, wb=wb)
+
+        if not casheet.open_workbook():
+            results.append((location, report_filename, 'fail',
+                            'Workbook Error', f'Failed to open: {casheet_file}'))
+            continue
+        wb = casheet.wb
+
+        if not casheet.filling(parser_data):
+            results.append((location, report_filename, 'fail',
+                            'Fill Error', f'Failed to fill: {casheet_file}'))
+            continue
+        filled_any = True
+
+        validation_passed = casheet.validate()
+        if validation_passed is None:
+            deferred.append((casheet, location, report_filename))
+        elif validation_passed:
+            results.append((location, report_filename, 'ok', None, None))
+        else:
+            results.append((location, report_filename, 'warn', None, None))
+
+    if wb is not None and filled_any:
+        try:
+            save_workbook(wb, casheet_path)
+            print(f"💾 Saved: {casheet_file}")
+        except PermissionError:
+            save_error = 'File is open in another program'
+            print(
+                f"❌ Cannot save {casheet_file}: File is open in another program")
+        except Exception as e:
+            save_error = str(e)[:50]
+            print(f"❌ Save error for {casheet_file}: {e}")
+        else:
+            save_error = None
+        if save_error is not None:
+            # None of the fills reached disk, and the deferred validations
+            # would read the stale pre-fill file - fail the whole bucket
+            failed = []
+            for location, report_filename, status, error_type, error_message in results:
+                if status != 'fail':
+                    status, error_type, error_message = (
+                        'fail', 'Save Error', save_error)
+                failed.append(
+                    (location, report_filename, status, error_type, error_message))
+            for _, location, report_filename in deferred:
+                failed.append(
+                    (location, report_filename, 'fail', 'Save Error', save_error))
+            return failed
+
+    for casheet, location, report_filename in deferred:
+        if casheet.validate_from_disk():
+            results.append((location, report_filename, 'ok', None, None))
+        else:
+            results.append((location, report_filename, 'warn', None, None))
+
+    return results
+
+
+def execute(reports_dir, casheet_dir, weekday, report_date, parallel=False):
     """
     Main execution function that processes all reports and generates summary.
 
@@ -283,20 +527,31 @@ def execute(reports_dir, casheet_dir, weekday, report_date):
         reports_dir (str): Directory containing report files
         casheet_dir (str): Directory containing cash sheet files
         report_date (str): Report date in MM/DD/YYYY format (empty string for yesterday)
+        parallel (bool): Fill independent casheet files in worker processes.
+            Off by default - saving over a locked network share can serialize
+            anyway, so this is opt-in via --parallel.
     """
 
     # Initialize tracking
     tracker = ProcessingTracker()
 
-    # Get all the reports
+    # Workbooks are loaded once per casheet file and saved once at the end,
+    # since several report locations share the same casheet
+    workbook_cache = {}
+    dirty_paths = {}
+    deferred_validations = []
+
+    # Get all the reports, classifying by extension in a single directory scan
     csv_files = []
     xls_files = []
     try:
-        for report_file_path in os.listdir(reports_dir):
-            if report_file_path.endswith(".csv"):
-                csv_files.append(report_file_path)
-            elif report_file_path.endswith(".xls"):
-                xls_files.append(report_file_path)
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                extension = entry.name.rpartition('.')[2].lower()
+                if extension == "csv":
+                    csv_files.append(entry.name)
+                elif extension == "xls":
+                    xls_files.append(entry.name)
     except FileNotFoundError:
         print(f"❌ Reports directory not found: {reports_dir}")
         return
@@ -306,13 +561,13 @@ def execute(reports_dir, casheet_dir, weekday, report_date):
 
     # Get all the casheets
     try:
-        casheet_files = [
-            casheet_file for casheet_file in os.listdir(casheet_dir)]
+        with os.scandir(casheet_dir) as entries:
+            casheet_files = [entry.name for entry in entries]
     except FileNotFoundError:
-        print(f"❌ Reports directory not found: {reports_dir}")
+        print(f"❌ Casheet directory not found: {casheet_dir}")
         return
     except PermissionError:
-        print(f"❌ Permission denied accessing: {reports_dir}")
+        print(f"❌ Permission denied accessing: {casheet_dir}")
         return
 
     # Check if no files found
@@ -323,34 +578,121 @@ def execute(reports_dir, casheet_dir, weekday, report_date):
     print(
         f"\n🔍 Found {len(csv_files)} CSV file(s) and {len(xls_files)} XLS file(s)")
 
+    # Resolve expected casheet names to files once for all reports
+    casheet_index = build_casheet_index(casheet_files)
+
+    # Small batches are not worth spinning up worker processes for
+    if parallel and len(csv_files) + len(xls_files) < PARALLEL_MIN_REPORTS:
+        parallel = False
+
+    if parallel:
+        # Parse everything up front (cheap compared to the Excel work), bucket
+        # by casheet file, and let worker processes handle the openpyxl
+        # load/fill/save for independent workbooks concurrently
+        buckets = {}
+        all_reports = ([(csv_file, InforParser) for csv_file in csv_files] +
+                       [(xls_file, TavloParser) for xls_file in xls_files])
+
+        for report_filename, parser_class in all_reports:
+            report_path = os.path.join(reports_dir, report_filename)
+            report_parser = parser_class(report_path, report_date)
+            resolved = _parse_and_resolve(
+                report_parser, casheet_dir, report_filename, tracker, casheet_index)
+            if resolved is None:
+                continue
+            parser_data, casheet_path, location_in_casheet = resolved
+            buckets.setdefault(casheet_path, []).append(
+                (parser_data, location_in_casheet,
+                 parser_data['location'], report_filename))
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(_fill_bucket, casheet_path, entries, weekday)
+                       for casheet_path, entries in buckets.items()]
+            for future in futures:
+                for location, report_filename, status, error_type, error_message in future.result():
+                    if status == 'ok':
+                        tracker.add_success(
+                            location, report_filename, has_warning=False)
+                    elif status == 'warn':
+                        tracker.add_success(
+                            location, report_filename, has_warning=True)
+                        tracker.add_validation_warning(
+                            location, report_filename)
+                    else:
+                        tracker.add_failure(
+                            location, report_filename, error_type, error_message)
+
+        tracker.print_summary()
+        return
+
     # Process Infor (CSV) reports
     for csv_file in csv_files:
         csv_path = os.path.join(reports_dir, csv_file)
         csv_report = InforParser(csv_path, report_date)
         process_report(csv_report, casheet_dir, weekday,
-                       csv_file, tracker, casheet_files)
+                       csv_file, tracker, casheet_index,
+                       workbook_cache, dirty_paths, deferred_validations)
 
     # Process Tavlo (XLS) reports
     for xls_file in xls_files:
         xls_path = os.path.join(reports_dir, xls_file)
         xls_report = TavloParser(xls_path, report_date)
         process_report(xls_report, casheet_dir, weekday,
-                       xls_file, tracker, casheet_files)
+                       xls_file, tracker, casheet_index,
+                       workbook_cache, dirty_paths, deferred_validations)
+
+    # Save each modified casheet exactly once; a failed save loses every fill
+    # recorded against that file, so downgrade those results to failures
+    saved_paths = set()
+    for casheet_path, path_reports in dirty_paths.items():
+        error_message = None
+        try:
+            save_workbook(workbook_cache[casheet_path], casheet_path)
+            saved_paths.add(casheet_path)
+            print(f"💾 Saved: {os.path.basename(casheet_path)}")
+        except PermissionError:
+            error_message = 'File is open in another program'
+            print(
+                f"❌ Cannot save {os.path.basename(casheet_path)}: File is open in another program")
+        except Exception as e:
+            error_message = str(e)[:50]
+            print(f"❌ Save error for {os.path.basename(casheet_path)}: {e}")
+        if error_message is not None:
+            for location, report_filename in path_reports:
+                tracker.downgrade_to_failure(
+                    location, report_filename, 'Save Error', error_message)
+
+    # Run the validations that needed saved (formula-evaluated) workbooks
+    for casheet, location, report_filename in deferred_validations:
+        if casheet.xl_path not in saved_paths:
+            continue
+        if not casheet.validate_from_disk():
+            tracker.flag_success_warning(location, report_filename)
+            tracker.add_validation_warning(location, report_filename)
 
     # Print comprehensive summary
     tracker.print_summary()
 
 
 if __name__ == "__main__":
+    # The tool ships as a PyInstaller-frozen exe; without this, --parallel
+    # worker processes re-run the whole program (prompt included) on Windows
+    freeze_support()
+
     # Run the processor
     weekday = None
     while not weekday:
         report_date = input("What cash sheet day that you trynna fill in? ")
-        # Default is yesterday
+        # Default is yesterday - take the weekday straight from the date
+        # object instead of stringifying and re-parsing it
         if report_date == "":
             yesterday = date.today() - timedelta(days=1)
             report_date = yesterday.strftime("%m/%d/%Y")
-        weekday = get_weekday_name(report_date)
+            weekday = yesterday.strftime("%A")
+            print(f"The date {report_date} is a {weekday}")
+        else:
+            weekday = get_weekday_name(report_date)
 
     execute(REPORTS_FOLDER, CASH_SHEET_FOLDER,
-            weekday=weekday, report_date=report_date)
+            weekday=weekday, report_date=report_date,
+            parallel="--parallel" in sys.argv)
@@ -4,10 +4,103 @@ Parses Tavlo sales reports (XML format) and extracts financial data including
 sales, taxes, guest counts, and tender breakdowns.
 """
 
-import xml.etree.ElementTree as ET
-import traceback
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
 from config import TAVLO_TENDERS, CASHEET_TENDERS
 
+# Prefer lxml's libxml2-backed parser when available - it is several times
+# faster on SpreadsheetML documents - but fall back to the stdlib parser so
+# the tool keeps working without the extra install
+try:
+    from lxml import etree as ET
+    _XML_PARSE_ERROR = ET.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSE_ERROR = ET.ParseError
+
+# On-disk cache of parsed reports, keyed by file identity so re-running the
+# tool over unchanged exports skips the XML work. Set CASHEET_NOCACHE=1 to
+# bypass it. Bump the version whenever the cached payload shape changes.
+_CACHE_VERSION = 1
+_CACHE_DIR = os.path.join(
+    os.path.expanduser('~'), '.cache', 'cash-sheet', 'tavlo')
+
+
+def _cache_path(xl_path, stat_result):
+    """Build the cache file path for one version of one report file."""
+    tag = (f"{_CACHE_VERSION}|{os.path.abspath(xl_path)}|"
+           f"{stat_result.st_mtime_ns}|{stat_result.st_size}")
+    digest = hashlib.blake2b(tag.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{digest}.pkl")
+
+
+# The section scan loops live at module level: plain functions over local
+# variables run noticeably faster in CPython than methods chasing attribute
+# chains, and keeping them free of self makes them easy to reason about.
+
+def _sum_counts(lines, start, end):
+    """Sum the numeric values of a section's rows."""
+    total = 0
+    for _, value in lines[start:end]:
+        if value is not None:
+            total += int(value)
+    return total
+
+
+def _scan_tax(lines, start, end, fields):
+    """
+    Collect the tax-section fields described by a (needle, field, label)
+    table, stopping once every field has been found.
+
+    Returns:
+        dict: field name -> float value for each field found
+    """
+    found = {}
+    wanted = len(fields)
+    for key, value in lines[start:end]:
+        if value is not None:
+            for needle, field, _ in fields:
+                if field not in found and needle in key:
+                    found[field] = float(value)
+                    break
+        if len(found) == wanted:
+            break
+    return found
+
+
+def _scan_tenders(lines, start, end, tender_map, skip_names, tenders):
+    """
+    Accumulate a section's tender amounts into the tenders dict.
+
+    Returns:
+        list: tender names that were not in the mapping
+    """
+    unrecognized = []
+    map_get = tender_map.get
+
+    for key, value in lines[start:end]:
+        tender_name = key.strip()
+
+        # Skip empty or summary rows
+        if not tender_name or value is None or tender_name in skip_names:
+            continue
+
+        # One lookup answers both the membership test and the casheet name
+        casheet_name = map_get(tender_name)
+        if casheet_name is None:
+            unrecognized.append(tender_name)
+            continue
+
+        # Numeric cells arrive as floats already; only coerce stragglers
+        if type(value) is not float:
+            value = float(value)
+        tenders[casheet_name] += value
+
+    return unrecognized
+
 
 class TavloParser:
     """
@@ -23,9 +116,23 @@ class TavloParser:
         lines (list): Raw data as list of (key, value) tuples
     """
 
+    # Fixed slots instead of a per-instance __dict__: batch runs create one
+    # parser per report, and slot access is also a shade faster
+    __slots__ = ('xl_path', 'data', 'index', 'lines', '_bounds', '_log')
+
     # XML namespace for Excel SpreadsheetML format
     NAMESPACES = {'ss': 'urn:schemas-microsoft-com:office:spreadsheet'}
 
+    # Clark-notation tag and attribute names, built once instead of being
+    # re-formatted on every row
+    _SS = NAMESPACES['ss']
+    _WORKSHEET_TAG = f'{{{_SS}}}Worksheet'
+    _ROW_TAG = f'{{{_SS}}}Row'
+    _DATA_TAG = f'{{{_SS}}}Data'
+    _SS_NAME_ATTR = f'{{{_SS}}}Name'
+    _SS_INDEX_ATTR = f'{{{_SS}}}Index'
+    _SS_TYPE_ATTR = f'{{{_SS}}}Type'
+
     # Section identifiers in the report
     SECTION_MARKERS = {
         'count': "Num Closed/Finished Orders",
@@ -35,6 +142,19 @@ class TavloParser:
         'custom_tenders': "Custom Tender"
     }
 
+    # Inverted once at class load so marker detection is a single dict
+    # lookup per row instead of a scan over SECTION_MARKERS
+    _MARKER_TO_SECTION = {marker: name for name, marker in SECTION_MARKERS.items()}
+
+    # Summary rows to skip inside the credit-card tender section
+    _CC_SKIP = frozenset({"Credit Card Payments", "Credit Card Tips"})
+
+    # Tax-section rows of interest: (key substring, data field, log label)
+    _TAX_FIELDS = (
+        ('Net Tax', 'tax', 'Tax'),
+        ('Total incl. Taxes', 'total_sales', 'Total Sales'),
+    )
+
     def __init__(self, xl_path, report_date=None):
         """
         Initialize the Tavlo parser.
@@ -49,11 +169,13 @@ class TavloParser:
             'total_sales': 0.0,
             'tax': 0.0,
             'count': 0,
-            'tenders': CASHEET_TENDERS.copy(),
+            'tenders': dict.fromkeys(CASHEET_TENDERS, 0.0),
             'location': ""
         }
         self.index = {}
         self.lines = []  # Stores (key, value) pairs from XML
+        self._bounds = {}  # Section name -> (start, end) line range
+        self._log = []
 
     def read_report(self):
         """
@@ -66,80 +188,79 @@ class TavloParser:
             bool: True if file read successfully, False otherwise
         """
         try:
-            # Parse the XML file
-            tree = ET.parse(self.xl_path)
-            root = tree.getroot()
-
-            # Find the "Financials" worksheet
-            financials_ws = self._find_financials_worksheet(root)
-            if financials_ws is None:
-                print("  ❌ Could not find 'Financials' sheet in the XML file")
+            worksheet_tag = self._WORKSHEET_TAG
+            row_tag = self._ROW_TAG
+            name_attr = self._SS_NAME_ATTR
+
+            # Stream the document instead of building a full DOM: rows of
+            # the Financials worksheet are ingested as their end tags
+            # arrive and cleared immediately, so memory stays bounded by a
+            # single row and other worksheets are skipped wholesale
+            in_financials = False
+            found_financials = False
+            line_index = 0
+
+            # Feed iterparse a binary file with a large buffer so the
+            # parser pulls big blocks instead of many small reads
+            with open(self.xl_path, 'rb', buffering=1 << 20) as f:
+                for event, elem in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        if (elem.tag == worksheet_tag and
+                                elem.get(name_attr) == 'Financials'):
+                            in_financials = True
+                            found_financials = True
+                        continue
+
+                    if in_financials and elem.tag == row_tag:
+                        line_index = self._handle_row_index(elem, line_index)
+
+                        key_val, val_val = self._extract_cell_data(elem)
+                        self.lines.append((key_val, val_val))
+                        self._update_section_index(key_val, line_index)
+
+                        line_index += 1
+                        elem.clear()
+
+                    elif elem.tag == worksheet_tag:
+                        if in_financials:
+                            # All Financials rows consumed; skip the rest
+                            break
+                        elem.clear()
+
+            if not found_financials:
+                self._log.append("  ❌ Could not find 'Financials' sheet in the XML file")
                 return False
 
-            # Find the table within the worksheet
-            table = financials_ws.find('ss:Table', self.NAMESPACES)
-            if table is None:
-                print("  ❌ Could not find Table in 'Financials' sheet")
-                return False
+            # Resolve each section's exact (start, end) range once: a
+            # section runs from the line after its marker to the first
+            # blank-key line. The parse_* methods then iterate their range
+            # directly instead of re-discovering the boundary themselves
+            lines = self.lines
+            n = len(lines)
+            for section_name, marker_line in self.index.items():
+                end = marker_line + 1
+                while end < n and lines[end][0]:
+                    end += 1
+                self._bounds[section_name] = (marker_line + 1, end)
 
-            # Process all rows and build line index
-            self._process_table_rows(table)
             return True
 
         except FileNotFoundError:
-            print(f"  ❌ File not found: {self.xl_path}")
+            self._log.append(f"  ❌ File not found: {self.xl_path}")
             return False
 
-        except ET.ParseError as e:
-            print(f"  ❌ XML parse error: {e}")
+        except _XML_PARSE_ERROR as e:
+            self._log.append(f"  ❌ XML parse error: {e}")
             return False
 
         except Exception as e:
-            print(f"  ❌ Error reading report: {e}")
+            self._log.append(f"  ❌ Error reading report: {e}")
+            # Imported lazily: traceback (and its linecache/tokenize deps)
+            # is only needed on this rare path
+            import traceback
             traceback.print_exc()
             return False
 
-    def _find_financials_worksheet(self, root):
-        """
-        Locate the 'Financials' worksheet in the XML document.
-
-        Args:
-            root: XML root element
-
-        Returns:
-            Element or None: The Financials worksheet element if found
-        """
-        for ws in root.findall('ss:Worksheet', self.NAMESPACES):
-            ws_name = ws.get(f"{{{self.NAMESPACES['ss']}}}Name")
-            if ws_name == 'Financials':
-                return ws
-        return None
-
-    def _process_table_rows(self, table):
-        """
-        Process all rows in the table and build the lines list and section index.
-
-        Args:
-            table: XML table element containing the data
-        """
-        line_index = 0
-
-        for row in table.findall('ss:Row', self.NAMESPACES):
-            # Handle rows with Index attribute (indicates skipped rows in XML)
-            line_index = self._handle_row_index(row, line_index)
-
-            # Extract cell data
-            cells = row.findall('ss:Cell', self.NAMESPACES)
-            key_val, val_val = self._extract_cell_data(cells)
-
-            # Store the line
-            self.lines.append((key_val, val_val))
-
-            # Update section index if this is a section marker
-            self._update_section_index(key_val, line_index)
-
-            line_index += 1
-
     def _handle_row_index(self, row, current_index):
         """
         Handle XML rows with Index attribute that indicate skipped rows.
@@ -151,42 +272,62 @@ class TavloParser:
         Returns:
             int: Updated line index
         """
-        row_index_attr = row.get(f"{{{self.NAMESPACES['ss']}}}Index")
+        row_index_attr = row.get(self._SS_INDEX_ATTR)
         if row_index_attr:
             target_index = int(row_index_attr) - 1  # Convert to 0-based
-            # Fill in empty rows that were skipped
-            while current_index < target_index:
-                self.lines.append(("", None))
-                current_index += 1
+            # Fill in empty rows that were skipped with one C-level extend
+            gap = target_index - current_index
+            if gap > 0:
+                self.lines.extend((("", None),) * gap)
+                current_index = target_index
         return current_index
 
-    def _extract_cell_data(self, cells):
+    def _extract_cell_data(self, row):
         """
         Extract key and value from the first two cells in a row.
 
+        Iterates the row's children directly rather than going through
+        findall/find, since only the first two cells and each cell's Data
+        child are ever needed.
+
         Args:
-            cells: List of cell elements
+            row: XML row element
 
         Returns:
             tuple: (key_string, value) where value is float if numeric, string otherwise
         """
         key_val = ""
         val_val = None
+        data_tag = self._DATA_TAG
 
-        # Extract key (first column)
-        if len(cells) > 0:
-            key_data = cells[0].find('ss:Data', self.NAMESPACES)
-            if key_data is not None and key_data.text:
-                key_val = str(key_data.text).strip()
+        for position, cell in enumerate(row):
+            if position > 1:
+                break
 
-        # Extract value (second column)
-        if len(cells) > 1:
-            val_data = cells[1].find('ss:Data', self.NAMESPACES)
-            if val_data is not None and val_data.text:
-                try:
-                    val_val = float(val_data.text)
-                except (ValueError, TypeError):
-                    val_val = str(val_data.text).strip()
+            # First Data child of the cell, if any
+            data = None
+            for child in cell:
+                if child.tag == data_tag:
+                    data = child
+                    break
+
+            if data is None or not data.text:
+                continue
+
+            if position == 0:
+                key_val = data.text.strip()
+            else:
+                # The ss:Type attribute says whether the cell is numeric,
+                # sparing string cells the cost of a failed float() call;
+                # untyped cells keep the old probe-and-fall-back behavior
+                cell_type = data.get(self._SS_TYPE_ATTR)
+                if cell_type == 'Number' or cell_type is None:
+                    try:
+                        val_val = float(data.text)
+                    except (ValueError, TypeError):
+                        val_val = data.text.strip()
+                else:
+                    val_val = data.text.strip()
 
         return key_val, val_val
 
@@ -198,10 +339,9 @@ class TavloParser:
             key: Cell key/label
             line_index: Current line index
         """
-        for section_name, marker in self.SECTION_MARKERS.items():
-            if key == marker:
-                self.index[section_name] = line_index
-                break
+        section_name = self._MARKER_TO_SECTION.get(key)
+        if section_name is not None:
+            self.index[section_name] = line_index
 
     def parse_location(self):
         """
@@ -217,8 +357,9 @@ class TavloParser:
                 raise ValueError("No data lines available")
 
             location_string = self.lines[0][0]
-            # Split on "Sales" and take the part before it
-            self.data['location'] = location_string.split("Sales")[0].strip()
+            # Take the part before "Sales"; partition stops at the first
+            # match without building a list of every split
+            self.data['location'] = location_string.partition("Sales")[0].strip()
 
             if not self.data['location']:
                 raise ValueError("Location name is empty after parsing")
@@ -226,7 +367,7 @@ class TavloParser:
             return True
 
         except Exception as e:
-            print(f"  ❌ Error parsing location: {e}")
+            self._log.append(f"  ❌ Error parsing location: {e}")
             return False
 
     def parse_count(self):
@@ -240,28 +381,20 @@ class TavloParser:
         """
         try:
             if "count" not in self.index:
-                print("  ❌ Guest count section not found in report")
+                self._log.append("  ❌ Guest count section not found in report")
                 return False
 
-            index = self.index["count"] + 1
-            total_count = 0
-
-            # Sum all counts until we hit an empty key
-            while index < len(self.lines) and self.lines[index][0]:
-                if self.lines[index][1] is not None:
-                    total_count += int(self.lines[index][1])
-                index += 1
-
-            self.data["count"] = total_count
-            print(f"  ✓ Guests: {self.data['count']}")
+            start, end = self._bounds["count"]
+            self.data["count"] = _sum_counts(self.lines, start, end)
+            self._log.append(f"  ✓ Guests: {self.data['count']}")
             return True
 
         except (ValueError, TypeError) as e:
-            print(f"  ❌ Error parsing guest count (invalid number): {e}")
+            self._log.append(f"  ❌ Error parsing guest count (invalid number): {e}")
             return False
 
         except Exception as e:
-            print(f"  ❌ Error parsing guest count: {e}")
+            self._log.append(f"  ❌ Error parsing guest count: {e}")
             return False
 
     def parse_tax(self):
@@ -275,49 +408,27 @@ class TavloParser:
         """
         try:
             if "tax" not in self.index:
-                print("  ❌ Tax section not found in report")
+                self._log.append("  ❌ Tax section not found in report")
                 return False
 
-            index = self.index["tax"] + 1
-            found_tax = False
-            found_total = False
-
-            # Search for both Net Tax and Total incl. Taxes
-            while index < len(self.lines) and self.lines[index][0]:
-                key = self.lines[index][0]
-                value = self.lines[index][1]
-
-                if value is not None:
-                    if 'Net Tax' in key:
-                        self.data["tax"] = float(value)
-                        print(f"  ✓ Tax: ${self.data['tax']:.2f}")
-                        found_tax = True
-
-                    elif 'Total incl. Taxes' in key:
-                        self.data["total_sales"] = float(value)
-                        print(
-                            f"  ✓ Total Sales: ${self.data['total_sales']:.2f}")
-                        found_total = True
-
-                index += 1
-
-                # Stop once we have both values
-                if found_tax and found_total:
-                    break
+            start, end = self._bounds["tax"]
+            found = _scan_tax(self.lines, start, end, self._TAX_FIELDS)
 
-            if not found_tax:
-                print("  ❌ Net Tax not found in tax section")
-            if not found_total:
-                print("  ❌ Total incl. Taxes not found in tax section")
+            for needle, field, label in self._TAX_FIELDS:
+                if field in found:
+                    self.data[field] = found[field]
+                    self._log.append(f"  ✓ {label}: ${found[field]:.2f}")
+                else:
+                    self._log.append(f"  ❌ {needle} not found in tax section")
 
-            return found_tax and found_total
+            return len(found) == len(self._TAX_FIELDS)
 
         except (ValueError, TypeError) as e:
-            print(f"  ❌ Error parsing tax (invalid number): {e}")
+            self._log.append(f"  ❌ Error parsing tax (invalid number): {e}")
             return False
 
         except Exception as e:
-            print(f"  ❌ Error parsing tax section: {e}")
+            self._log.append(f"  ❌ Error parsing tax section: {e}")
             return False
 
     def _parse_tender_section(self, section_name):
@@ -332,47 +443,28 @@ class TavloParser:
         """
         try:
             if section_name not in self.index:
-                print(f"  ℹ️  Section '{section_name}' not found. Skipping.")
+                self._log.append(f"  ℹ️  Section '{section_name}' not found. Skipping.")
                 return True  # Not an error, section just doesn't exist
 
-            index = self.index[section_name] + 1
-            unrecognized_tenders = []
-
-            # Process all tender entries until empty key
-            while index < len(self.lines) and self.lines[index][0]:
-                tender_name = self.lines[index][0].strip()
-                tender_value = self.lines[index][1]
-
-                # Skip empty or summary rows
-                if (not tender_name or
-                    tender_value is None or
-                        tender_name in ["Credit Card Payments", "Credit Card Tips"]):
-                    index += 1
-                    continue
-
-                # Map tender to casheet name and add amount
-                if tender_name in TAVLO_TENDERS:
-                    casheet_tender_name = TAVLO_TENDERS[tender_name]
-                    self.data["tenders"][casheet_tender_name] += float(
-                        tender_value)
-                else:
-                    unrecognized_tenders.append(tender_name)
-
-                index += 1
+            start, end = self._bounds[section_name]
+            unrecognized_tenders = _scan_tenders(
+                self.lines, start, end, TAVLO_TENDERS, self._CC_SKIP,
+                self.data["tenders"])
 
             # Report unrecognized tenders
             if unrecognized_tenders:
-                print(
+                self._log.append(
                     f"  ⚠️  Unrecognized tenders in {section_name}: {', '.join(unrecognized_tenders)}")
 
             return True
 
         except (ValueError, TypeError) as e:
-            print(f"  ❌ Error in {section_name} (invalid number): {e}")
+            self._log.append(f"  ❌ Error in {section_name} (invalid number): {e}")
             return False
 
         except Exception as e:
-            print(f"  ❌ Error parsing {section_name}: {e}")
+            self._log.append(f"  ❌ Error parsing {section_name}: {e}")
+            import traceback
             traceback.print_exc()
             return False
 
@@ -403,79 +495,146 @@ class TavloParser:
         """
         try:
             if "coupons" not in self.index:
-                print("  ℹ️  No 'Coupon/Voucher' section found. Skipping.")
+                self._log.append("  ℹ️  No 'Coupon/Voucher' section found. Skipping.")
                 return True  # Not an error, just no coupons
 
-            index = self.index["coupons"] + 1
+            start, end = self._bounds["coupons"]
 
-            # Navigate to the end of the coupon section (last non-empty row)
-            while index < len(self.lines) and self.lines[index][0]:
-                index += 1
-
-            # The total should be on the last row before empty
-            if index > self.index["coupons"] + 1:
-                coupon_key = self.lines[index - 1][0]
-                coupon_value = self.lines[index - 1][1]
+            # The total sits on the last row of the section, which the
+            # bounds recorded in read_report point at directly
+            if end > start:
+                coupon_key, coupon_value = self.lines[end - 1]
 
                 if coupon_value is not None and "Total" in coupon_key:
                     converted_coupons_name = TAVLO_TENDERS["Coupons"]
                     self.data["tenders"][converted_coupons_name] = float(
                         coupon_value)
-                    print(
+                    self._log.append(
                         f"  ✓ Coupons: ${self.data['tenders'][converted_coupons_name]:.2f}")
                     return True
 
-            print("  ⚠️  Could not find coupon total line")
+            self._log.append("  ⚠️  Could not find coupon total line")
             return True  # Not fatal, continue processing
 
         except (ValueError, TypeError) as e:
-            print(f"  ❌ Error parsing coupons (invalid number): {e}")
+            self._log.append(f"  ❌ Error parsing coupons (invalid number): {e}")
             return False
 
         except Exception as e:
-            print(f"  ❌ Error parsing coupons: {e}")
+            self._log.append(f"  ❌ Error parsing coupons: {e}")
+            return False
+
+    def _load_cached(self, cache_file):
+        """
+        Restore parsed state from the on-disk cache, if present.
+
+        Returns:
+            bool: True if the cache held a usable entry
+        """
+        try:
+            with open(cache_file, 'rb') as fh:
+                data, lines, index, bounds = pickle.load(fh)
+        except (OSError, pickle.PickleError, ValueError, EOFError):
             return False
 
+        # The report date comes from the caller, not the file
+        data['date'] = self.data['date']
+        self.data = data
+        self.lines = lines
+        self.index = index
+        self._bounds = bounds
+        return True
+
+    def _store_cached(self, cache_file):
+        """Write parsed state to the on-disk cache; failures are ignored."""
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump(
+                        (self.data, self.lines, self.index, self._bounds),
+                        fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def _flush_log(self):
+        """Emit all buffered progress messages with a single stdout write."""
+        if self._log:
+            self._log.append('')
+            sys.stdout.write('\n'.join(self._log))
+            self._log.clear()
+
     def parse(self):
         """
         Main parsing method - orchestrates parsing of all sections.
 
+        Successful results are cached on disk keyed by the report file's
+        path, mtime and size, so re-running over unchanged exports skips
+        the XML parse entirely (set CASHEET_NOCACHE=1 to disable). Progress
+        messages from all stages are buffered and written to stdout in one
+        call when parsing finishes.
+
         Returns:
             bool: True if all sections parsed successfully, False otherwise
         """
-        # Step 1: Read the XML file
-        if not self.read_report():
-            return False
+        try:
+            cache_file = None
+            if os.environ.get('CASHEET_NOCACHE') != '1':
+                try:
+                    cache_file = _cache_path(self.xl_path,
+                                             os.stat(self.xl_path))
+                except OSError:
+                    cache_file = None
+                if cache_file and self._load_cached(cache_file):
+                    self._log.append(
+                        f"  ✓ Loaded cached parse for {self.xl_path}")
+                    return True
 
-        # Step 2: Parse location name
-        if not self.parse_location():
-            return False
+            # Step 1: Read the XML file
+            if not self.read_report():
+                return False
 
-        # Print parsing header
-        print(f"\n{'=' * 70}")
-        print(f"Parsing: {self.xl_path}")
-        print(f"Location: {self.data['location']}")
-        print(f"Date: {self.data['date']}")
-        print(f"{'=' * 70}")
-
-        # Step 3: Parse all data sections
-        ok_count = self.parse_count()
-        ok_tax = self.parse_tax()
-        ok_cc = self.parse_cc()
-        ok_custom = self.parse_custom_tender()
-        ok_coupon = self.parse_coupon()
-
-        # Check if all sections parsed successfully
-        if not all([ok_count, ok_tax, ok_cc, ok_custom, ok_coupon]):
-            print(f"{'=' * 70}")
-            print("❌ Parsing failed on one or more sections")
-            print(f"{'=' * 70}\n")
-            return False
+            # Step 2: Parse location name
+            if not self.parse_location():
+                return False
 
-        print(f"{'=' * 70}")
-        print("✅ Parsing successful!")
-        print(f"{'=' * 70}")
-        return True
+            # Parsing header
+            self._log.append(f"\n{'=' * 70}")
+            self._log.append(f"Parsing: {self.xl_path}")
+            self._log.append(f"Location: {self.data['location']}")
+            self._log.append(f"Date: {self.data['date']}")
+            self._log.append(f"{'=' * 70}")
+
+            # Step 3: Parse all data sections
+            ok_count = self.parse_count()
+            ok_tax = self.parse_tax()
+            ok_cc = self.parse_cc()
+            ok_custom = self.parse_custom_tender()
+            ok_coupon = self.parse_coupon()
+
+            # Check if all sections parsed successfully
+            if not all([ok_count, ok_tax, ok_cc, ok_custom, ok_coupon]):
+                self._log.append(f"{'=' * 70}")
+                self._log.append("❌ Parsing failed on one or more sections")
+                self._log.append(f"{'=' * 70}\n")
+                return False
+
+            self._log.append(f"{'=' * 70}")
+            self._log.append("✅ Parsing successful!")
+            self._log.append(f"{'=' * 70}")
+
+            if cache_file:
+                self._store_cached(cache_file)
+
+            return True
+
+        finally:
+            self._flush_log()
 
     # ==================== PROPERTY ACCESSORS ====================
 